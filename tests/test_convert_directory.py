@@ -1,7 +1,10 @@
 #!/usr/bin/python
 # Jeison Cardoso
 
+import inspect
 import os
+import shutil
+import sys
 import pytest
 
 from test_base import concat_path, equals_files, clean_files
@@ -28,3 +31,75 @@ class TestConvertDirectories:
 
         assert equals_files("input_alternative_utf8.srt",
                             "valid_output_utf8.srt", "utf-8")
+
+    def test_convert_directory_parallel(self, clean_files):
+        """Test convert directory with worker processes"""
+        convert_file = ConvertDirectories(
+            concat_path("."), True, "utf-8", jobs=2)
+        convert_file.convert()
+
+        assert equals_files("input_alternative_utf8.srt",
+                            "valid_output_utf8.srt", "utf-8")
+        assert equals_files("idd.srt",
+                            "valid_output_idd.srt", "utf-8")
+
+    def test_convert_directory_sequential_by_default(self, clean_files, monkeypatch):
+        """Test convert directory does not start worker processes by default"""
+        def no_pool(*args, **kwargs):
+            raise AssertionError("worker pool started")
+        monkeypatch.setattr("vtt_to_srt.vtt_to_srt.ProcessPoolExecutor", no_pool)
+        convert_file = ConvertDirectories(
+            concat_path("."), True, "utf-8")
+        convert_file.convert()
+
+        assert equals_files("input_alternative_utf8.srt",
+                            "valid_output_utf8.srt", "utf-8")
+
+    def test_convert_directory_threads(self, clean_files):
+        """Test convert directory with worker threads"""
+        convert_file = ConvertDirectories(
+            concat_path("."), True, "utf-8", jobs=2, threads=True)
+        convert_file.convert()
+
+        assert equals_files("input_alternative_utf8.srt",
+                            "valid_output_utf8.srt", "utf-8")
+        assert equals_files("idd.srt",
+                            "valid_output_idd.srt", "utf-8")
+
+    def test_convert_directory_only_vtt_extension(self, tmp_path):
+        """Test convert directory matches the vtt extension only, in any case"""
+        shutil.copy(concat_path("input_utf8.vtt"), str(tmp_path / "upper.VTT"))
+        shutil.copy(concat_path("input_utf8.vtt"), str(tmp_path / "backup.vtt.bak"))
+        convert_file = ConvertDirectories(str(tmp_path), False, "utf-8", jobs=1)
+        convert_file.convert()
+
+        assert sorted(os.listdir(str(tmp_path))) == ["backup.vtt.bak", "upper.VTT", "upper.srt"]
+
+    def test_convert_directory_same_srt_once(self, tmp_path):
+        """Test convert directory converts only one of the vtt files with the same srt file"""
+        shutil.copy(concat_path("input_utf8.vtt"), str(tmp_path / "a.VTT"))
+        shutil.copy(concat_path("idd.vtt"), str(tmp_path / "a.vtt"))
+        convert_file = ConvertDirectories(str(tmp_path), False, "utf-8", jobs=2, threads=True)
+        convert_file.convert()
+
+        assert sorted(os.listdir(str(tmp_path))) == ["a.VTT", "a.srt", "a.vtt"]
+        with open(concat_path("valid_output_utf8.srt"), "rb") as file:
+            assert (tmp_path / "a.srt").read_bytes() == file.read()
+
+    def test_convert_directory_deep_tree(self, tmp_path):
+        """Test convert directory deeper than the recursion limit"""
+        deepest = str(tmp_path)
+        for _ in range(100):
+            deepest = os.path.join(deepest, "d")
+        os.makedirs(deepest)
+        shutil.copy(concat_path("input_utf8.vtt"), os.path.join(deepest, "deep.vtt"))
+        convert_file = ConvertDirectories(str(tmp_path), True, "utf-8", jobs=1)
+
+        recursion_limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(len(inspect.stack(0)) + 50)
+        try:
+            convert_file.convert()
+        finally:
+            sys.setrecursionlimit(recursion_limit)
+
+        assert os.path.exists(os.path.join(deepest, "deep.srt"))
@@ -2,6 +2,7 @@
 # Jeison Cardoso
 
 import os
+import shutil
 import pytest
 
 from test_base import concat_path, equals_files, clean_files
@@ -43,4 +44,34 @@ class TestConvertFile:
         convert_file.convert()
         
         assert equals_files("idd_format.srt",
-                            "valid_output_idd_format.srt", "utf-8")                            
+                            "valid_output_idd_format.srt", "utf-8")
+
+    def test_convert_file_wrong_encoding_no_output(self, tmp_path):
+        """Test convert file with the wrong encoding does not leave an output file"""
+        shutil.copy(concat_path("input_iso-8859-2.vtt"), str(tmp_path / "input.vtt"))
+        convert_file = ConvertFile(str(tmp_path / "input.vtt"), "utf-8")
+        with pytest.raises(UnicodeDecodeError):
+            convert_file.convert()
+
+        assert os.listdir(str(tmp_path)) == ["input.vtt"]
+
+    def test_convert_file_wrong_encoding_keeps_srt(self, tmp_path):
+        """Test convert file with the wrong encoding leaves an existing srt file as it was"""
+        shutil.copy(concat_path("input_iso-8859-2.vtt"), str(tmp_path / "input.vtt"))
+        (tmp_path / "input.srt").write_bytes(b"1\n00:00:00,000 --> 00:00:01,000\nkeep\n")
+        convert_file = ConvertFile(str(tmp_path / "input.vtt"), "utf-8")
+        with pytest.raises(UnicodeDecodeError):
+            convert_file.convert()
+
+        assert sorted(os.listdir(str(tmp_path))) == ["input.srt", "input.vtt"]
+        assert (tmp_path / "input.srt").read_bytes() == b"1\n00:00:00,000 --> 00:00:01,000\nkeep\n"
+
+    def test_convert_file_bom(self, tmp_path):
+        """Test convert file with a BOM read as utf-8"""
+        with open(concat_path("input_utf8.vtt"), "rb") as file:
+            contents = file.read()
+        (tmp_path / "input.vtt").write_bytes(b"\xef\xbb\xbf" + contents)
+        ConvertFile(str(tmp_path / "input.vtt"), "utf-8").convert()
+
+        with open(concat_path("valid_output_utf8.srt"), "rb") as file:
+            assert (tmp_path / "input.srt").read_bytes() == file.read()
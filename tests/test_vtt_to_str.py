@@ -1,9 +1,13 @@
 ﻿#!/usr/bin/python
 # Jeison Cardoso
 
+import io
+import os
+import threading
 import pytest
 
-from vtt_to_srt.vtt_to_srt import VttToStr
+from test_base import concat_path
+from vtt_to_srt.vtt_to_srt import VttToStr, _write_output, convert_content, _finalize
 
 
 class TestVttToStr:
@@ -20,6 +24,16 @@ class TestVttToStr:
         assert repr(vtt_to_str.convert_timestamp("08.500 --> 15.300\n")
                     ) == repr("00:00:08,500 --> 00:00:15,300\n")
 
+    def test_has_timestamp(self):
+        vtt_to_str = VttToStr()
+        assert vtt_to_str.has_timestamp("00:03:08,500 --> 00:03:15,300")
+        assert vtt_to_str.has_timestamp("00:03:08,500 --> 00:03:15,300 line:0")
+        assert not vtt_to_str.has_timestamp("00:03:08,500 --> 00:03:15,30")
+        assert not vtt_to_str.has_timestamp("00:03:08.500 --> 00:03:15.300")
+        assert not vtt_to_str.has_timestamp("00:03:08,500 -> 00:03:15,3000")
+        assert not vtt_to_str.has_timestamp("0a:03:08,500 --> 00:03:15,300")
+        assert not vtt_to_str.has_timestamp("")
+
     def test_not_add_sequence_before(self):
         vtt_to_str = VttToStr()
         assert repr(vtt_to_str.add_sequence_numbers("What you got, a billion could've never bought (oooh)")) == repr(
@@ -45,9 +59,80 @@ class TestVttToStr:
         assert repr(vtt_to_str.convert_content("WEBVTT\nKind: captions\nLanguage: zh-TW")
                     ) == repr("Language: zh-TW\n")
 
+    def test_convert_style_header_and_tags(self):
+        vtt_to_str = VttToStr()
+        contents = ("WEBVTT\nKind: captions\nLanguage: en\nStyle:\n"
+                    "::cue(c.colorCCCCCC) { color: rgb(204,204,204);\n }\n"
+                    "::cue(c.colorE5E5E5) { color: rgb(229,229,229);\n }\n##\n\n"
+                    "00:00.000 --> 00:02.000\nhel<00:00:00.500><c.colorCCCCCC> lo</c>\n")
+        assert repr(vtt_to_str.convert_content(contents)) == repr(
+            "1\n00:00:00,000 --> 00:00:02,000\nhel lo\n")
+
     def test_text(self):
         vtt_to_str = VttToStr()
         assert repr(vtt_to_str.convert_content("告訴你，今晚我想帶你出去。")) == repr(
             "告訴你，今晚我想帶你出去。\n")
         assert repr(vtt_to_str.convert_content("What you got, a billion could've never bought (oooh)")) == repr(
             "What you got, a billion could've never bought (oooh)\n")
+
+    def test_module_functions(self):
+        assert repr(convert_content("WEBVTT\n\n00:01.000 --> 00:04.000\nHello\n")) == repr(
+            "1\n00:00:01,000 --> 00:00:04,000\nHello\n")
+
+    def test_convert_content_fast_same_as_convert_content(self):
+        vtt_to_str = VttToStr()
+        for contents in ["", "WEBVTT\nKind: captions\nLanguage: zh-TW", "告訴你，今晚我想帶你出去。", "Hi --> MAX"]:
+            assert repr(vtt_to_str.convert_content_fast(contents)) == repr(
+                vtt_to_str.convert_content(contents))
+
+    def test_convert_content_fast_files(self):
+        vtt_to_str = VttToStr()
+        for vtt, srt, remove_format in [("input_utf8.vtt", "valid_output_utf8.srt", False),
+                                        ("idd.vtt", "valid_output_idd.srt", False),
+                                        ("idd_format.vtt", "valid_output_idd_format.srt", True)]:
+            with io.open(concat_path(vtt), "r", encoding="utf-8") as file:
+                contents = file.read()
+            with io.open(concat_path(srt), "r", encoding="utf-8") as file:
+                expected = file.read()
+            assert repr(vtt_to_str.convert_content_fast(contents, remove_format)) == repr(expected)
+
+    def test_convert_content_fast_style_and_tags(self):
+        vtt_to_str = VttToStr()
+        contents = ("WEBVTT\nKind: captions\nLanguage: en\nStyle:\n"
+                    "::cue(c.colorCCCCCC) { color: rgb(204,204,204);\n }\n##\n\n"
+                    "00:00.000 --> 00:02.000 align:start position:0%\n"
+                    "hel<00:00:00.500><c> lo</c>\n\n"
+                    "NOTE a comment\nthat spans lines\n\n"
+                    "00:02.000 --> 00:03.000\nworld\n")
+        assert repr(vtt_to_str.convert_content_fast(contents)) == repr(
+            "1\n00:00:00,000 --> 00:00:02,000\nhel lo\n\n2\n00:00:02,000 --> 00:00:03,000\nworld\n")
+
+    def test_finalize_same_as_separate_passes(self):
+        vtt_to_str = VttToStr()
+        for contents in ["", "\n\n", "告訴你，今晚我想帶你出去。", "Hi --> MAX",
+                         "x\n2\n3\n00:00:01,000 --> 00:00:02,000\ny\n\n\n7"]:
+            expected = vtt_to_str.add_sequence_numbers(
+                vtt_to_str.remove_simple_identifiers(vtt_to_str.remove_blank_lines(contents)))
+            assert repr(_finalize(contents)) == repr(expected)
+
+    def test_write_and_read_file(self, tmp_path):
+        vtt_to_str = VttToStr()
+        filename = str(tmp_path / "output.srt")
+        vtt_to_str.write_file(filename, "1\n00:00:01,000 --> 00:00:02,000\n告訴你\n")
+        assert repr(vtt_to_str.read_file(filename)) == repr(
+            "1\n00:00:01,000 --> 00:00:02,000\n告訴你\n")
+
+    def test_write_output_same_file_from_threads(self, tmp_path):
+        filename = str(tmp_path / "out.srt")
+
+        def chunks():
+            yield "first\n"
+            # Another thread writes the same file while this one is writing
+            thread = threading.Thread(target=_write_output, args=(filename, ["second\n"]))
+            thread.start()
+            thread.join()
+            yield "end\n"
+
+        assert _write_output(filename, chunks()) == filename
+        assert os.listdir(str(tmp_path)) == ["out.srt"]
+        assert (tmp_path / "out.srt").read_text() == "first\nend\n"
@@ -6,179 +6,441 @@
 import os
 import re
 import argparse
-from string import Template
-from stat import S_ISDIR, ST_MODE, S_ISREG
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 
 import io 
 
-class VttToStr:
-    """Convert vtt to srt"""
+_HEADER = r"WEBVTT\n|Kind:[ \-\w]+\n|Language:[ \-\w]+\n"
+# hh:mm:ss, mm:ss or ss as fixed length alternatives, each in its own group
+_VTT_TIME = r"(?:(\d\d:\d\d:\d\d)|(\d\d:\d\d)|(\d\d))\.(\d{0,3})"
+_VTT_TS = _VTT_TIME + " --> " + _VTT_TIME + r"(?:[ \-\w]+:[\w\%\d:,.]+)*\n"
+_CUE_TAGS = r"<c[.\w\d]*>|</c>|<\d\d:\d\d:\d\d\.\d\d\d>"
+_STYLE_BLOCK = r"::[\-\w]+\([\-.\w\d]+\)[ ]*\{[.,:;\(\) \-\w\d]+\n \}\n"
+_FORMAT_TAG = r"<[^>]*>"
+_DIGITS = r"^\d+$"
+_NOTE = r"NOTE(?:[ \t]|$)"
 
-    def __init__(self) :
-        pass
+_RE_HEADER = re.compile(_HEADER)
+_RE_VTT_TS = re.compile(_VTT_TS)
+# Style header first, so its style blocks and ## go away with it
+_STYLE = r"Style:\n(?:" + _STYLE_BLOCK + r")*##\n|" + _STYLE_BLOCK
+_RE_STRIP = re.compile(_STYLE + "|" + _CUE_TAGS)
+_RE_CUE_TAGS = re.compile(_CUE_TAGS)
+_RE_FORMAT_TAG = re.compile(_FORMAT_TAG)
+_RE_DIGITS = re.compile(_DIGITS)
+_RE_NOTE = re.compile(_NOTE)
 
-    def convert_header(self, contents) :
-        """Convert of vtt header to srt format
 
-        :contents -- contents of vtt file
-        """
-        replacement = re.sub(r"WEBVTT\n", "", contents)
-        replacement = re.sub(r"Kind:[ \-\w]+\n", "", replacement)
-        replacement = re.sub(r"Language:[ \-\w]+\n", "", replacement)
-        return replacement
+_STATE_HEADER, _STATE_STYLE, _STATE_BODY, _STATE_NOTE = range(4)
 
-    def add_padding_to_timestamp(self, contents) :
-        """Add 00 to padding timestamp of to srt format
+_LINE_BLANK, _LINE_TEXT, _LINE_DIGITS, _LINE_TIMESTAMP = range(4)
 
-        :contents -- contents of vtt file
-        """
-        find_srt = Template(r'$a,$b --> $a,$b(?:[ \-\w]+:[\w\%\d:,.]+)*\n')
-        minute = r"((?:\d\d:){1}\d\d)"
-        second = r"((?:\d\d:){0}\d\d)"
-        padding_minute = find_srt.substitute(a=minute, b=r"(\d{0,3})")
-        padding_second = find_srt.substitute(a=second, b=r"(\d{0,3})")
-        replacement = re.sub(
-            padding_minute, r"00:\1,\2 --> 00:\3,\4\n", contents)
-        return re.sub(padding_second, r"00:00:\1,\2 --> 00:00:\3,\4\n", replacement)
-
-    def convert_timestamp(self, contents) :
-        """Convert timestamp of vtt file to srt format
-
-        :contents -- contents of vtt file
-        """
-        find_vtt = Template(r'$a.$b --> $a.$b(?:[ \-\w]+:[\w\%\d:,.]+)*\n')
-        all_timestamp = find_vtt.substitute(
-            a=r"((?:\d\d:){0,2}\d\d)", b=r"(\d{0,3})")
-        return self.add_padding_to_timestamp(re.sub(all_timestamp, r"\1,\2 --> \3,\4\n", contents))
+_BUFFER_SIZE = 1 << 20
 
-    def convert_content(self, contents, remove_format = False) : 
-        """Convert content of vtt file to srt format
 
-        :contents -- contents of vtt file
-        """
-        replacement = self.convert_timestamp(contents)
-        replacement = self.convert_header(replacement)
-        replacement = re.sub(r"<c[.\w\d]*>", "", replacement)
-        replacement = re.sub(r"</c>", "", replacement)
-        replacement = re.sub(r"<\d\d:\d\d:\d\d.\d\d\d>", "", replacement)
-        replacement = re.sub(
-            r"::[\-\w]+\([\-.\w\d]+\)[ ]*{[.,:;\(\) \-\w\d]+\n }\n", "", replacement)
-        replacement = re.sub(r"Style:\n##\n", "", replacement)
-        if remove_format:
-            replacement = re.sub(r"<[^>]*>", "", replacement)  
-        replacement = self.remove_blank_lines(replacement)
-        replacement = self.remove_simple_identifiers(replacement)
-        replacement = self.add_sequence_numbers(replacement)
-
-        return replacement
-
-    def has_timestamp(self, content) : 
-        """Check if line is a timestamp srt format
-
-        :contents -- contents of vtt file
-        """
-        return re.match(r"((\d\d:){2}\d\d),(\d{3}) --> ((\d\d:){2}\d\d),(\d{3})", content) is not None
+def _pad_timestamp(hours, minutes, seconds):
+    """Pad a vtt timestamp to the srt hh:mm:ss form
 
-    def add_sequence_numbers(self, contents) : 
-        """Adds sequence numbers to subtitle contents and returns new subtitle contents
+    :hours -- hh:mm:ss form or None
+    :minutes -- mm:ss form or None
+    :seconds -- ss form or None
+    """
+    if hours:
+        return hours
+    if minutes:
+        return "00:" + minutes
+    return "00:00:" + seconds
 
-        :contents -- contents of vtt file
-        """
-        lines = contents.split('\n')
-        out = ''
-        counter = 1
-        for line in lines:
-            if self.has_timestamp(line):
-                out += str(counter) + '\n'
-                counter += 1
-            out += line + '\n'
-        return out
-    
-    def remove_blank_lines(self, contents): 
-        # Remove useless blank lines from the vtt file 
-        lines = contents.split('\n')
-        lines = [x for x in lines if x != '']
-        lines.append('')
-        out = []
-        num = 0
-        while num < len(lines) :
-            if re.match(r"^\d+$", lines[num]) and self.has_timestamp(lines[num + 1]):
-                if num == 0 :
-                    pass
-                else:
-                    out.append('')
-                out.append(lines[num])
-                out.append(lines[num + 1])
-                num += 2
-            elif self.has_timestamp(lines[num]): 
-                if num == 0 :
-                    pass
-                else :
-                    out.append('')
-                out.append(lines[num])
-                num += 1
-            else:
-                out.append(lines[num])
-                num += 1
-        out.pop()
-        return '\n'.join(out)
-        
-    def remove_simple_identifiers(self, contents) : 
-        """Remove simple identifiers of vtt file
-
-        :contents -- contents of vtt file
-        """
-        lines = contents.split('\n')
-        out = []
-        for i, line in enumerate(lines):
-            if self.has_timestamp(line):
-                if re.match(r"^\d+$", lines[i - 1]):
-                    out.pop()
+
+def _srt_timestamp(match):
+    """Build the srt timestamp line from a _RE_VTT_TS match
+
+    :match -- match object of a vtt timestamp line
+    """
+    groups = match.groups()
+    return "{0},{1} --> {2},{3}".format(
+        _pad_timestamp(*groups[0:3]), groups[3], _pad_timestamp(*groups[4:7]), groups[7])
+
+
+def convert_header(contents):
+    """Convert of vtt header to srt format
+
+    :contents -- contents of vtt file
+    """
+    return _RE_HEADER.sub("", contents)
+
+
+def convert_timestamp(contents):
+    """Convert timestamp of vtt file to srt format
+
+    :contents -- contents of vtt file
+    """
+    return _RE_VTT_TS.sub(lambda match: _srt_timestamp(match) + "\n", contents)
+
+
+def convert_content(contents, remove_format = False):
+    """Convert content of vtt file to srt format
+
+    :contents -- contents of vtt file
+    """
+    replacement = convert_timestamp(contents)
+    replacement = convert_header(replacement)
+    replacement = _RE_STRIP.sub("", replacement)
+    if remove_format:
+        replacement = _RE_FORMAT_TAG.sub("", replacement)
+    return _finalize(replacement)
+
+
+def _classify_lines(contents):
+    """Yield (flag, line) for each line of srt contents
+
+    :contents -- contents of srt file without sequence numbers
+    """
+    for line in contents.split('\n'):
+        if line == '':
+            yield _LINE_BLANK, line
+        elif has_timestamp(line):
+            yield _LINE_TIMESTAMP, line
+        elif _RE_DIGITS.match(line):
+            yield _LINE_DIGITS, line
+        else:
+            yield _LINE_TEXT, line
+
+
+def _finalize(contents):
+    """Remove blank lines and simple identifiers and add sequence numbers
+    in a single pass, same as remove_blank_lines, remove_simple_identifiers
+    and add_sequence_numbers in sequence
+
+    :contents -- contents of srt file without sequence numbers
+    """
+    out = []
+    pending_id = None
+    counter = 1
+    for flag, line in _classify_lines(contents):
+        if flag == _LINE_BLANK:
+            continue
+        if flag == _LINE_TIMESTAMP:
+            # A cue identifier right before the timestamp is dropped
+            pending_id = None
+            if out:
+                out.append('')
+            out.append(str(counter))
+            out.append(line)
+            counter += 1
+            continue
+        if pending_id is not None:
+            out.append(pending_id)
+            pending_id = None
+        if flag == _LINE_DIGITS:
+            pending_id = line
+        else:
             out.append(line)
-        return '\n'.join(out)
 
-    def write_file(self, filename, data, encoding_format = "utf-8"):
-        """Create a file with some data
+    if pending_id is not None:
+        out.append(pending_id)
+    return '\n'.join(out) + '\n'
+
+
+def convert_content_fast(contents, remove_format = False):
+    """Convert content of vtt file to srt format in a single pass
+
+    Every line is classified once by a small state machine instead of
+    running a chain of regex passes over the whole file. Unlike
+    convert_content it follows the cue structure, so the output differs
+    for some files:
+
+    - NOTE and STYLE blocks are dropped
+    - Kind: and Language: lines are only removed from the header block
+    - timestamps with 2 digit milliseconds get a sequence number
+    - a leading BOM is skipped
+
+    :contents -- contents of vtt file
+    :remove_format -- remove the format tags like bold & italic
+    """
+    return "".join(_iter_convert(io.StringIO(contents), remove_format))
+
+
+def _iter_convert(lines, remove_format = False):
+    """Convert vtt lines to srt format, yielding the output in chunks
+
+    :lines -- iterable of vtt lines, with their line endings
+    :remove_format -- remove the format tags like bold & italic
+    """
+    state = _STATE_HEADER
+    block_start = True
+    pending_id = None
+    counter = 1
+    written = False
+    for line in lines:
+        if state == _STATE_HEADER:
+            # Decoding without a -sig codec leaves the BOM in the first line
+            if line.startswith("\ufeff"):
+                line = line[1:]
+            if _RE_HEADER.match(line):
+                continue
+            if line == "Style:\n":
+                state = _STATE_STYLE
+                continue
+            state = _STATE_BODY
+        elif state == _STATE_STYLE:
+            if line == "\n":
+                state = _STATE_BODY
+            elif line == "##\n":
+                state = _STATE_HEADER
+            continue
+        elif state == _STATE_NOTE:
+            if line == "\n":
+                state = _STATE_BODY
+                block_start = True
+            continue
+
+        if line == "\n":
+            block_start = True
+            continue
+        if block_start and (_RE_NOTE.match(line) or line.rstrip("\n") == "STYLE"):
+            state = _STATE_NOTE
+            continue
+        block_start = False
+
+        timestamp = _RE_VTT_TS.match(line)
+        if timestamp:
+            pending_id = None
+            yield "{0}{1}\n{2}\n".format(
+                "\n" if written else "", counter, _srt_timestamp(timestamp))
+            written = True
+            counter += 1
+            continue
+
+        text = line.rstrip("\n")
+        # Tags all start with <, skip the regexes for plain text lines
+        if "<" in text:
+            text = _RE_CUE_TAGS.sub("", text)
+            if remove_format:
+                text = _RE_FORMAT_TAG.sub("", text)
+        if text == "":
+            continue
+        if pending_id is not None:
+            yield pending_id + "\n"
+            pending_id = None
+            written = True
+        if _RE_DIGITS.match(text):
+            # Could be a cue identifier, only known at the next line
+            pending_id = text
+        else:
+            yield text + "\n"
+            written = True
+
+    if pending_id is not None:
+        yield pending_id + "\n"
+    elif not written:
+        yield "\n"
+
+
+def has_timestamp(content):
+    """Check if line is a timestamp srt format
+
+    :contents -- contents of vtt file
+    """
+    # hh:mm:ss,mmm --> hh:mm:ss,mmm has its separators at fixed positions
+    return (len(content) >= 29 and content[2] == ':' and content[5] == ':'
+            and content[8] == ',' and content[12:17] == ' --> '
+            and content[19] == ':' and content[22] == ':' and content[25] == ','
+            and content[0:2].isdecimal() and content[3:5].isdecimal()
+            and content[6:8].isdecimal() and content[9:12].isdecimal()
+            and content[17:19].isdecimal() and content[20:22].isdecimal()
+            and content[23:25].isdecimal() and content[26:29].isdecimal())
+
+
+def add_sequence_numbers(contents):
+    """Adds sequence numbers to subtitle contents and returns new subtitle contents
+
+    :contents -- contents of vtt file
+    """
+    lines = contents.split('\n')
+    out = []
+    counter = 1
+    for line in lines:
+        if has_timestamp(line):
+            out.append(str(counter))
+            counter += 1
+        out.append(line)
+    return '\n'.join(out) + '\n'
+
+
+def remove_blank_lines(contents):
+    # Remove useless blank lines from the vtt file 
+    lines = contents.split('\n')
+    lines = [x for x in lines if x != '']
+    lines.append('')
+    out = []
+    num = 0
+    while num < len(lines) :
+        if _RE_DIGITS.match(lines[num]) and has_timestamp(lines[num + 1]):
+            if num == 0 :
+                pass
+            else:
+                out.append('')
+            out.append(lines[num])
+            out.append(lines[num + 1])
+            num += 2
+        elif has_timestamp(lines[num]): 
+            if num == 0 :
+                pass
+            else :
+                out.append('')
+            out.append(lines[num])
+            num += 1
+        else:
+            out.append(lines[num])
+            num += 1
+    out.pop()
+    return '\n'.join(out)
+    
 
-        :filename -- filename pat
-        :data -- data to write
-        :encoding_format -- encoding format
-        """
+
+def remove_simple_identifiers(contents):
+    """Remove simple identifiers of vtt file
+
+    :contents -- contents of vtt file
+    """
+    lines = contents.split('\n')
+    out = []
+    for i, line in enumerate(lines):
+        if has_timestamp(line):
+            if _RE_DIGITS.match(lines[i - 1]):
+                out.pop()
+        out.append(line)
+    return '\n'.join(out)
+
+
+def write_file(filename, data, encoding_format = "utf-8"):
+    """Create a file with some data
+
+    :filename -- filename pat
+    :data -- data to write
+    :encoding_format -- encoding format
+    """
+    filename = _write_output(filename, [data], encoding_format)
+    print("file created {0}\n".format(filename))
+
+
+def read_file(filename, encoding_format = "utf-8"):
+    """Read a file text
+
+    :filename -- filename path
+    :encoding_format -- encoding format
+    """
+    content = ''
+    
+    with io.open(filename, mode="r", encoding=encoding_format, buffering=_BUFFER_SIZE) as file:
+        print("file being read: {0}\n".format(filename))
+        content = file.read()
+    return content
+
+
+def _write_output(filename, chunks, encoding_format = "utf-8"):
+    """Write the output file through a temporary file next to it, which only
+    replaces the file once every chunk is written, falling back to the
+    current directory when the file can not be created next to the input
+
+    :filename -- filename path
+    :chunks -- iterable of the data to write
+    :encoding_format -- encoding format
+    :return -- filename written
+    """
+    temp_filename = _temp_filename(filename)
+    try:
+        file = io.open(temp_filename, "w", encoding=encoding_format, buffering=_BUFFER_SIZE)
+    except IOError:
+        filename = filename.split(os.sep)[-1]
+        temp_filename = _temp_filename(filename)
+        file = io.open(temp_filename, "w", encoding=encoding_format, buffering=_BUFFER_SIZE)
+    try:
+        with file:
+            for chunk in chunks:
+                file.write(chunk)
+        os.replace(temp_filename, filename)
+    except BaseException:
+        # Leave an existing file as it was, without a half written one
         try:
-           
-            with io.open(filename, "w", encoding=encoding_format) as file:
-                file.writelines(data)
-             
-        except IOError:
-            filename = filename.split(os.sep)[-1]
-            with open(filename, "w") as file:
-                file.writelines(str(data.encode(encoding_format)))
-        print("file created {0}\n".format(filename))
-
-    def read_file(self, filename, encoding_format = "utf-8"):
-        """Read a file text
-
-        :filename -- filename path
-        :encoding_format -- encoding format
-        """
-        content = ''
-        
-        with io.open(filename, mode="r", encoding=encoding_format) as file:
-            print("file being read: {0}\n".format(filename))
-            content = file.read()
-        return content
+            os.remove(temp_filename)
+        except OSError:
+            pass
+        raise
+    return filename
 
-    def process(self, filename, remove_format, encoding_format = "utf-8"):
-        """Convert vtt file to a srt file
 
-        :str_name_file -- filename path
-        :encoding_format -- encoding format
-        """
-        file_contents = self.read_file(filename, encoding_format)
-        str_data = ""
-        str_data = str_data + self.convert_content(file_contents, remove_format)
-        filename = filename.replace(".vtt", ".srt")
-        self.write_file(filename, str_data, encoding_format)
+def _temp_filename(filename):
+    """Name of the temporary file for filename, unique to the calling
+    process and thread, as worker threads may write the same file
+
+    :filename -- filename path
+    """
+    return "{0}.{1}.{2}.tmp".format(filename, os.getpid(), threading.get_ident())
+
+
+def _srt_filename(filename):
+    """Name of the srt file converted from a vtt file
+
+    :filename -- vtt filename path
+    """
+    return os.path.splitext(filename)[0] + ".srt"
+
+
+def process(filename, remove_format, encoding_format = "utf-8"):
+    """Convert vtt file to a srt file, streaming it line by line
+
+    The output is that of convert_content_fast. An existing srt file is only
+    replaced once the whole file is converted.
+
+    :str_name_file -- filename path
+    :encoding_format -- encoding format
+    """
+    srt_filename = _srt_filename(filename)
+    with io.open(filename, mode="r", encoding=encoding_format, buffering=_BUFFER_SIZE) as vtt_file:
+        print("file being read: {0}\n".format(filename))
+        srt_filename = _write_output(srt_filename, _iter_convert(vtt_file, remove_format),
+                                     encoding_format)
+    print("file created {0}\n".format(srt_filename))
+
+
+class VttToStr:
+    """Convert vtt to srt
+
+    The class holds no state, its methods forward to the module functions
+    of the same name.
+    """
+
+    def __init__(self) :
+        pass
+
+    convert_header = staticmethod(convert_header)
+    convert_timestamp = staticmethod(convert_timestamp)
+    convert_content = staticmethod(convert_content)
+    convert_content_fast = staticmethod(convert_content_fast)
+    has_timestamp = staticmethod(has_timestamp)
+    add_sequence_numbers = staticmethod(add_sequence_numbers)
+    remove_blank_lines = staticmethod(remove_blank_lines)
+    remove_simple_identifiers = staticmethod(remove_simple_identifiers)
+    write_file = staticmethod(write_file)
+    read_file = staticmethod(read_file)
+    process = staticmethod(process)
+
+
+def _convert_one(filename, remove_format, encoding_format):
+    """Convert a single vtt file, top level so worker processes can pickle it
+
+    :filename -- vtt file path
+    :remove_format -- remove the format tags like bold & italic
+    :encoding_format -- encoding format
+    """
+    try:
+        process(filename, remove_format, encoding_format)
+    except UnicodeDecodeError:
+        print("UnicodeDecodeError: {0}".format(filename))
 
 
 class ConvertFile:
@@ -193,87 +455,137 @@ class ConvertFile:
         self.pathname = pathname
         self.encoding_format = encoding_format
         self.remove_format = remove_format
-        self.vtt_to_str = VttToStr()
 
     def convert(self):
         """Convert vtt file to srt file"""
-        if ".vtt" in self.pathname:
-            self.vtt_to_str.process(self.pathname, self.remove_format, self.encoding_format)
+        if self.pathname.lower().endswith(".vtt"):
+            process(self.pathname, self.remove_format, self.encoding_format)
 
 
 class ConvertDirectories:
     """Convert vtt files to srt files"""
 
-    def __init__(self, pathname , enable_recursive , encoding_format, remove_format = False ):
+    def __init__(self, pathname , enable_recursive , encoding_format, remove_format = False, jobs = 1,
+                 threads = False):
         """Constructor
 
         pathname -- path to file or directory
         :enable_recursive -- enable recursive
         :encoding_format -- encoding format
+        :jobs -- number of workers, 1 to convert in this process, None to use all cpus
+            (twice as many with threads); worker processes need the main module
+            guarded by if __name__ == "__main__" on spawn platforms
+        :threads -- use worker threads instead of processes, for I/O bound batches
         """
         self.pathname = pathname
         self.enable_recursive = enable_recursive
         self.encoding_format = encoding_format
         self.remove_format = remove_format
-        self.vtt_to_str = VttToStr()
+        self.jobs = jobs
+        self.threads = threads
 
     def _walk_dir(self, top_most_path, callback):
-        """Walk a directory
+        """Walk a directory, calling the callback function for each vtt file
 
         :top_most_path -- parent directory
         :callback -- function to call
         """
-        for file in os.listdir(top_most_path):
-            pathname = os.path.join(top_most_path, file)
-            if not os.path.isdir(pathname):
-                # It"s a file, call the callback function
-                callback(pathname)
+        with os.scandir(top_most_path) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith(".vtt"):
+                    callback(entry.path)
 
     def _walk_tree(self, top_most_path, callback):
-        """Recursively descend the directory tree rooted at top_most_path,
-        calling the callback function for each regular file
+        """Descend the directory tree rooted at top_most_path, calling the
+        callback function for each vtt file
 
         :top_most_path -- parent directory
         :callback -- function to call
         """
-        for file in os.listdir(top_most_path):
-            pathname = os.path.join(top_most_path, file)
-            mode = os.stat(pathname)[ST_MODE]
-            if S_ISDIR(mode):
-                # It's a directory, recurse into it
-                self._walk_tree(pathname, callback)
-            elif S_ISREG(mode):
-                # It's a file, call the callback function
-                callback(pathname)
-            else:
-                # Unknown file type, print a message
-                print("Skipping {0}".format(pathname))
+        for pathname in self._walk_tree_iter(top_most_path):
+            callback(pathname)
+
+    def _walk_tree_iter(self, top_most_path):
+        """Yield each vtt file of the directory tree rooted at top_most_path,
+        using an explicit stack so deep trees do not hit the recursion limit
+
+        :top_most_path -- parent directory
+        """
+        stack = [top_most_path]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # It's a directory, descend into it later
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        if entry.name.lower().endswith(".vtt"):
+                            yield entry.path
+                    else:
+                        # Unknown file type, print a message
+                        print("Skipping {0}".format(entry.path))
 
     def convert_vtt_to_str(self, file):
         """Convert vtt file to string
 
         :file -- file to convert
         """
-        if ".vtt" in file:
-            try:
-                self.vtt_to_str.process(file, self.remove_format, self.encoding_format)
-            except UnicodeDecodeError:
-                print("UnicodeDecodeError: {0}".format(file))
+        _convert_one(file, self.remove_format, self.encoding_format)
 
     def _vtt_to_srt_batch(self, directory):
         """Walk down directory searching for vtt files
 
         :directory -- path to search
+        :return -- list of vtt files found
         """
-        top_most_path = directory
         if self.enable_recursive:
-            self._walk_tree(top_most_path, self.convert_vtt_to_str)
+            files = list(self._walk_tree_iter(directory))
         else:
-            self._walk_dir(top_most_path, self.convert_vtt_to_str)
+            files = []
+            self._walk_dir(directory, files.append)
+        return self._unique_outputs(files)
+
+    def _unique_outputs(self, files):
+        """Keep one vtt file per srt file, as x.vtt and x.VTT both convert
+        to x.srt, the first one in sorted order
+
+        :files -- vtt files found
+        :return -- sorted list of vtt files with distinct srt files
+        """
+        outputs = {}
+        unique = []
+        for file in sorted(files):
+            output = os.path.normcase(_srt_filename(file))
+            if output in outputs:
+                print("Skipping {0}, {1} already converts to the same srt file".format(
+                    file, outputs[output]))
+                continue
+            outputs[output] = file
+            unique.append(file)
+        return unique
 
     def convert(self):
         """Convert vtt files to srt files"""
-        self._vtt_to_srt_batch(self.pathname)
+        files = self._vtt_to_srt_batch(self.pathname)
+        jobs = self.jobs
+        if not jobs:
+            # Threads mostly wait on the disk, so more of them keep the cpus busy
+            jobs = (os.cpu_count() or 1) * (2 if self.threads else 1)
+        jobs = min(jobs, len(files))
+        if jobs <= 1:
+            for file in files:
+                self.convert_vtt_to_str(file)
+            return
+
+        convert_one = partial(_convert_one, remove_format=self.remove_format,
+                              encoding_format=self.encoding_format)
+        if self.threads:
+            executor = ThreadPoolExecutor(max_workers=jobs)
+        else:
+            executor = ProcessPoolExecutor(max_workers=jobs)
+        with executor:
+            for _ in executor.map(convert_one, files, chunksize=8):
+                pass
 
 
 def _show_usage():
@@ -281,7 +593,9 @@ def _show_usage():
     print("\nUsage:\tvtt_to_srt pathname [-r]\n")
     print("\tpathname\t- a file or directory with files to be converted")
     print("\t-r\t\t- walk path recursively")
-    print("\t-rf\t\t- remove the format tags like bold & italic from output files\n")
+    print("\t-rf\t\t- remove the format tags like bold & italic from output files")
+    print("\t-j N\t\t- number of workers for directories")
+    print("\t-t\t\t- use worker threads instead of processes\n")
 
 
 def _parse_args():
@@ -296,6 +610,10 @@ def _parse_args():
                         help="encoding format for input and output files")
     parser.add_argument("-rf", "--remove_format",
                         help="remove the format tags like bold & italic from output files", action="store_true")
+    parser.add_argument("-j", "--jobs", type=int,
+                        help="number of workers for directories, defaults to the number of cpus")
+    parser.add_argument("-t", "--threads",
+                        help="use worker threads instead of processes, for I/O bound batches", action="store_true")
 
     args = parser.parse_args()
     return args
@@ -309,6 +627,8 @@ def main():
     recursive = args.recursive
     encoding = args.encoding
     remove_format = args.remove_format
+    jobs = args.jobs
+    threads = args.threads
 
     if not encoding:
         encoding = "utf-8"
@@ -319,7 +639,7 @@ def main():
 
     if os.path.isdir(pathname):
         print("directory being converted: {0}\n".format(pathname))
-        ConvertDirectories(pathname, recursive, encoding, remove_format).convert()
+        ConvertDirectories(pathname, recursive, encoding, remove_format, jobs, threads).convert()
 
     if not os.path.isfile(pathname) and not os.path.isdir(pathname):
         print("pathname is not a file or directory: {0}\n".format(pathname))